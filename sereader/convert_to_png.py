@@ -10,19 +10,247 @@ Date: 2020
 #===============
 #=== Imports ===
 #===============
-import sys;
-import numpy as np;
-import logging;
-import struct;
+import sys
+import os
+import mmap
+import numpy as np
+import logging
+import struct
+
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
 #For plotting
 import matplotlib
 import matplotlib.pyplot as plt
 
+#Module-level logger so the parse functions are usable on import
+#handlers are configured by the caller (or in __main__ below)
+log = logging.getLogger(__name__)
+
+#Optional numba support: the calibration kernel is JIT-compiled when
+#numba is installed and falls back to plain numpy otherwise
+try:
+    from numba import njit
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
+#========================
+#=== Header layouts ===
+#========================
+#Precompiled layouts for the fixed-size header fields so each header is
+#unpacked with a single C-level call instead of several int.from_bytes()
+#and struct.unpack() calls on freshly allocated slices
+
+#Byte order mark, series ID and series Version (bytes 0-6)
+_HDR_HEAD = struct.Struct('<HHH')
+#Data type ID and Tag type ID (bytes 6-14)
+_HDR_IDS = struct.Struct('<II')
+#Total and valid number of elements (bytes 14-22)
+_HDR_COUNTS = struct.Struct('<II')
+#Single scalar fields: 2/4/8 byte unsigned and 8 byte double
+_H = struct.Struct('<H')
+_I = struct.Struct('<I')
+_Q = struct.Struct('<Q')
+_D = struct.Struct('<d')
+#Calibration Offset, Delta and Element of a dimension array element
+_CAL = struct.Struct('<ddI')
+#The complete fixed-size binary header in one layout; the two
+#versions only differ in the width of the Offset Array Offset field
+_HDR_210 = struct.Struct('<HHHIIIIII')
+_HDR_220 = struct.Struct('<HHHIIIIQI')
+#Fixed fields of a 1D data element header
+_HDR_1D = struct.Struct('<ddIHI')
+#Fixed fields of a 2D data element header
+_HDR_2D = struct.Struct('<ddIddIHII')
+
+#==========================
+#=== Format constants ===
+#==========================
+#Integer values of the magic numbers so validation is a plain integer
+#compare; hex() is only used when building error and log messages
+
+_MAGIC_LE = 0x4949 #Little endian byte order mark
+
+_VALID_SERIES_ID_SET = {0x197}
+_VALID_SERIES_VERSION_SET = {0x210, 0x220}
+
+#Byte width of the Offset Array Offset (and the offset tables) per
+#series version, plus the matching struct and numpy representations,
+#so no function needs an if-chain on the version
+_OAO_LEN = {0x210: 4, 0x220: 8}
+_OAO_STRUCT = {4: _I, 8: _Q}
+_OAO_DTYPE = {4: np.uint32, 8: np.uint64}
+
+_DATA_TYPE_1D = 0x4120 #1D array elements
+_DATA_TYPE_2D = 0x4122 #2D array elements
+_VALID_DATA_TYPE_ID_SET = {0x1420, 0x1422, _DATA_TYPE_1D, _DATA_TYPE_2D}
+
+_TAG_TYPE_TIME = 0x4152 #time tag only
+_TAG_TYPE_TIME_AND_POSITION = 0x4142 #time and 2D position tag
+_VALID_TAG_TYPE_ID_SET = {_TAG_TYPE_TIME, _TAG_TYPE_TIME_AND_POSITION}
+
+#Structured (SoA) layouts of the per-element tags so a packed tag
+#stream can be read with a single np.frombuffer call
+_TAG_DT_TIME = np.dtype([('tid','<u4'),('ts','<u4')])
+_TAG_DT_POS = np.dtype([('tid','<u4'),('ts','<u4'),('x','<f8'),('y','<f8')])
+
+#All fixed fields of a 2D data element header as a structured dtype
+#(field order matches _HDR_2D) so the per-frame metadata of a series
+#lands in one contiguous typed array instead of parallel lists
+_META_2D_DT = np.dtype([('cal_off_x','<f8'),('cal_delta_x','<f8'),('cal_elem_x','<u4'),
+        ('cal_off_y','<f8'),('cal_delta_y','<f8'),('cal_elem_y','<u4'),
+        ('dtype_id','<u2'),('w','<u4'),('h','<u4')])
+
+#All fixed fields of a dimension array element as a structured dtype
+#so they are read with a single np.frombuffer call
+_DIM_HDR_DT = np.dtype([('dim_size','<u4'),
+        ('cal_offset','<f8'),('cal_delta','<f8'),('cal_elem','<u4'),
+        ('desc_len','<u4')])
+
+#Element DataType value -> numpy dtype of the stored data as
+#described in the documentation (all little endian)
+_TIA_DTYPE = {1:'<u1', 2:'<u2', 3:'<u4',
+        4:'<i1', 5:'<i2', 6:'<i4',
+        7:'<f4', 8:'<f8',
+        9:'<c8', 10:'<c16'}
+
 #=================
 #=== Functions ===
 #=================
+#=== File access ===
+def open_ser(input_path):
+    """Memory-map the .ser file instead of reading it into RAM
+
+    The returned mmap object supports the buffer protocol, so all the
+    slicing, unpack_from() and np.frombuffer() calls below work on it
+    unchanged while the OS only pages in the parts actually touched.
+    This keeps the peak memory at the working set rather than the
+    file size, which matters for multi-GB spectrum series.
+
+    :param input_path: path to the .ser file
+
+    :return: a read-only mmap of the file
+    """
+    fd = os.open(input_path, os.O_RDONLY)
+    ser_map = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    os.close(fd)
+
+    #A full parse walks the file mostly front-to-back, so hint the
+    #kernel to use aggressive readahead where madvise is available
+    if hasattr(ser_map, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+        ser_map.madvise(mmap.MADV_SEQUENTIAL)
+
+    return ser_map
+
+def read_all_elements(input_path, DataOffsetArray, elem_bytes, data_dtype='<u2', header_bytes=0):
+    """Batch-read the data blocks of every element in the series
+
+    The element offsets come from the Data Offset Array and point at
+    the element *header*, so header_bytes must hold the header size
+    (26 for 1D and 50 for 2D elements) to land on the data block.
+    Instead of faulting in the blocks one-by-one through the mmap,
+    this advises the kernel up front about every block (posix_fadvise
+    WILLNEED where available) and then reads them with positioned
+    pread() calls. The prefetch lets the device queue the requests
+    while Python is still wrapping the earlier blocks, which is
+    considerably faster on a cold cache. On platforms without pread()
+    (e.g. Windows) plain seek + read is used instead.
+
+    :param input_path: path to the .ser file
+    :param DataOffsetArray: the output of get_Data_Offset_Array()
+    :param elem_bytes: the size of one element data block in bytes
+        (excluding the header)
+    :param data_dtype: the numpy dtype of the stored data
+    :param header_bytes: the element header size skipped before each
+        data block: 26 for 1D and 50 for 2D elements
+
+    :return: a list with one numpy array per element
+    """
+    fd = os.open(input_path, os.O_RDONLY)
+
+    try:
+        #Kick off readahead for every block before touching any of them
+        if hasattr(os, 'posix_fadvise'):
+            for element_offset in DataOffsetArray:
+                os.posix_fadvise(fd, int(element_offset) + header_bytes, elem_bytes, os.POSIX_FADV_WILLNEED)
+
+        if hasattr(os, 'pread'):
+            element_list = [np.frombuffer(os.pread(fd, elem_bytes, int(element_offset) + header_bytes), dtype=data_dtype)
+                    for element_offset in DataOffsetArray]
+        else:
+            #No positioned reads on this platform
+            element_list = []
+            for element_offset in DataOffsetArray:
+                os.lseek(fd, int(element_offset) + header_bytes, os.SEEK_SET)
+                element_list.append(np.frombuffer(os.read(fd, elem_bytes), dtype=data_dtype))
+    finally:
+        os.close(fd)
+
+    return element_list
+
 #=== Header ===
+#All the fields of the fixed-size binary header in one structure
+Header = namedtuple('Header', ['series_id', 'series_version',
+        'data_type_id', 'tag_type_id',
+        'n_total', 'n_valid',
+        'oao_len', 'offset_array_offset',
+        'n_dimensions'])
+
+def parse_header(byte_array):
+    """Parse the complete fixed-size binary header in a single pass
+
+    This fuses the check_series_ID_and_Version(),
+    get_data_and_tag_ID(), get_total_and_valid_element_num(),
+    get_Offset_Array_Offset() and get_Number_of_Dimensions() chain:
+    the version is probed from the first 6 bytes, then all remaining
+    fields are unpacked with one call using the version-specific
+    layout, so nothing is re-sliced or re-computed downstream.
+
+    :param byte_array: the mapped (or read in) .ser file
+
+    :return: a Header namedtuple with all the header fields
+    """
+    #Probe the byte order, series ID and Version first as the full
+    #layout depends on the version
+    byte_order, series_ID, series_Version = _HDR_HEAD.unpack_from(byte_array, 0)
+
+    if byte_order != _MAGIC_LE:
+        raise ValueError("Invalid byte ordering: {0:s}".format(hex(byte_order)))
+    if series_ID not in _VALID_SERIES_ID_SET:
+        raise ValueError("Invalid series ID: {0:s}".format(hex(series_ID)))
+    if series_Version not in _VALID_SERIES_VERSION_SET:
+        raise ValueError("Invalid series Version: {0:s}".format(hex(series_Version)))
+
+    Offset_Array_Offset_length = _OAO_LEN[series_Version]
+    header_struct = _HDR_210 if Offset_Array_Offset_length == 4 else _HDR_220
+
+    #Unpack the full header with a single call
+    _, _, _, data_type_ID, tag_type_ID, \
+    N_total_element, N_valid_element, \
+    Offset_Array_Offset, Number_of_Dimensions = header_struct.unpack_from(byte_array, 0)
+
+    #Validity checks as in the individual getter functions
+    if data_type_ID not in _VALID_DATA_TYPE_ID_SET:
+        raise ValueError("Invalid data type ID: {0:s}".format(hex(data_type_ID)))
+    if tag_type_ID not in _VALID_TAG_TYPE_ID_SET:
+        raise ValueError("Invalid tag type ID: {0:s}".format(hex(tag_type_ID)))
+    if N_total_element < N_valid_element:
+        raise ValueError("Total number of elements ({0:d}) is lower than valid elements ({1:d})!".format(
+                N_total_element,N_valid_element))
+
+    log.info("Series ID: %s Version: %s", hex(series_ID),hex(series_Version))
+    log.info("Total (valid) number of elements: %d (%d)", N_total_element,N_valid_element)
+    log.info("The Offset Array Offset is: %d", Offset_Array_Offset)
+    log.info("Number of Dimensions: %d", Number_of_Dimensions)
+
+    return Header(series_ID, series_Version,
+            data_type_ID, tag_type_ID,
+            N_total_element, N_valid_element,
+            Offset_Array_Offset_length, Offset_Array_Offset,
+            Number_of_Dimensions)
+
 def check_series_ID_and_Version(byte_array):
     """Read the first 6 bytes in and
     Check the validity of the
@@ -35,25 +263,23 @@ def check_series_ID_and_Version(byte_array):
     
     :return: series_Version as it will be needed later
     """
-    #Asser little endian encoding
-    assert hex(int.from_bytes(byte_array[0:2], 'little')) == '0x4949', "Invalid byte ordering: {0:s}".format(
-            hex(int.from_bytes(byte_array[0:2], 'little')));
+    #Read the byte order mark, ID and Version in one unpack
+    byte_order, series_ID, series_Version = _HDR_HEAD.unpack_from(byte_array, 0)
 
-    #Valid ID's and Versions
-    valid_series_ID_list = ['0x197'];
-    valid_series_Version_list = ['0x210','0x220'];
+    #Asser little endian encoding
+    if byte_order != _MAGIC_LE:
+        raise ValueError("Invalid byte ordering: {0:s}".format(hex(byte_order)))
 
     #Chek ID and version validity
-    series_ID = hex(int.from_bytes(byte_array[2:4], 'little'));
-    series_Version = hex(int.from_bytes(byte_array[4:6], 'little'));
+    log.info("Series ID: %s", hex(series_ID))
+    log.info("Series Version: %s", hex(series_Version))
 
-    log.info("Series ID: {0:s}".format(series_ID));
-    log.info("Series Version: {0:s}".format(series_Version)); 
+    if series_ID not in _VALID_SERIES_ID_SET:
+        raise ValueError("Invalid series ID: {0:s}".format(hex(series_ID)))
+    if series_Version not in _VALID_SERIES_VERSION_SET:
+        raise ValueError("Invalid series Version: {0:s}".format(hex(series_Version)))
 
-    assert series_ID in valid_series_ID_list, "Invalid series ID: {0:s}".format(series_ID);
-    assert series_Version in valid_series_Version_list, "Invalid series ID: {0:s}".format(series_Version);
-
-    return series_Version;
+    return series_Version
 
 def get_data_and_tag_ID(byte_array):
     """Get the data type ID
@@ -61,27 +287,26 @@ def get_data_and_tag_ID(byte_array):
 
     return: 
     """
-    #Valid Data and Tag type ID's
-    valid_data_type_ID_list = ['0x1420','0x1422'];
-    valid_tag_type_ID_list = ['0x4152','0x4142'];
+    #Read both ID fields with a single unpack
+    data_type_ID, tag_type_ID = _HDR_IDS.unpack_from(byte_array, 6)
 
     #Data type
-    data_type_ID = hex(int.from_bytes(byte_array[6:10], 'little'));
-    if data_type_ID == '0x4120':
-        log.info("Tag Type ID: {0:s} : 1D array".format(data_type_ID));
-    elif data_type_ID == '0x4122':
-        log.info("Tag Type ID: {0:s} : 2D array".format(data_type_ID));
+    if data_type_ID == _DATA_TYPE_1D:
+        log.info("Tag Type ID: %s : 1D array", hex(data_type_ID))
+    elif data_type_ID == _DATA_TYPE_2D:
+        log.info("Tag Type ID: %s : 2D array", hex(data_type_ID))
     else:
-        assert data_type_ID in valid_data_type_ID_list, "Invalid data type ID: {0:s}".format(data_type_ID);
+        if data_type_ID not in _VALID_DATA_TYPE_ID_SET:
+            raise ValueError("Invalid data type ID: {0:s}".format(hex(data_type_ID)))
 
     #Tag type
-    tag_type_ID = hex(int.from_bytes(byte_array[10:14], 'little'));
-    if tag_type_ID == '0x4152':
-        log.info("Tag Type ID: {0:s} : time tag only".format(tag_type_ID));
-    elif tag_type_ID == '0x4142':
-        log.info("Tag Type ID: {0:s} : time and 2D position tag".format(tag_type_ID));
+    if tag_type_ID == _TAG_TYPE_TIME:
+        log.info("Tag Type ID: %s : time tag only", hex(tag_type_ID))
+    elif tag_type_ID == _TAG_TYPE_TIME_AND_POSITION:
+        log.info("Tag Type ID: %s : time and 2D position tag", hex(tag_type_ID))
     else:
-        assert tag_type_ID in valid_tag_type_ID_list, "Invalid tag type ID: {0:s}".format(tag_type_ID);
+        if tag_type_ID not in _VALID_TAG_TYPE_ID_SET:
+            raise ValueError("Invalid tag type ID: {0:s}".format(hex(tag_type_ID)))
 
     return data_type_ID, tag_type_ID
 
@@ -93,19 +318,19 @@ def get_total_and_valid_element_num(byte_array):
     return:
     """
 
-    #Number of total elements
-    N_total_element = int.from_bytes(byte_array[14:18], 'little');
-    log.info("Total number of elements: {0:d}".format(N_total_element));
+    #Number of total and valid elements with a single unpack
+    N_total_element, N_valid_element = _HDR_COUNTS.unpack_from(byte_array, 14)
 
-    N_valid_element = int.from_bytes(byte_array[18:22], 'little');
-    log.info("Valid number of elements: {0:d}".format(N_valid_element));
+    log.info("Total number of elements: %d", N_total_element)
+    log.info("Valid number of elements: %d", N_valid_element)
 
-    assert N_total_element >= N_valid_element, "Total number of elements ({0:d}) is lower than valid elements ({1:d})!".format(
-            N_total_element,N_valid_element);
+    if N_total_element < N_valid_element:
+        raise ValueError("Total number of elements ({0:d}) is lower than valid elements ({1:d})!".format(
+                N_total_element,N_valid_element))
 
     #Check if all data is written
     if N_total_element != N_valid_element:
-        log.info("Not all elements of the series were written!");
+        log.info("Not all elements of the series were written!")
 
 def get_Offset_Array_Offset(byte_array, SeriesVersion):
     """Get the Offset Array Offset
@@ -119,25 +344,19 @@ def get_Offset_Array_Offset(byte_array, SeriesVersion):
     :param: SeriesVersion the output from check_series_ID_and_Version
     """
 
-    #Get the series version
-
-    #Due the fact that only two valid series version exist in the code
-    #and in the documentation so far, we only use these cases
+    #Get the byte width for this series version from the lookup table
+    Offset_Array_Offset_length = _OAO_LEN[SeriesVersion]
+    Offset_Array_Offset_struct = _OAO_STRUCT[Offset_Array_Offset_length]
 
-    if SeriesVersion == "0x210":
-        Offset_Array_Offset_length = int(4);
-    elif SeriesVersion == "0x220":
-        Offset_Array_Offset_length = int(8);
-
-    log.info("The Offset Array Offset byte length is: {0:d}".format(Offset_Array_Offset_length));
+    log.info("The Offset Array Offset byte length is: %d", Offset_Array_Offset_length)
 
     #Get the actual value of the offset
-    Offset_Array_Offset = int.from_bytes(byte_array[22:22+Offset_Array_Offset_length], 'little');
+    Offset_Array_Offset = Offset_Array_Offset_struct.unpack_from(byte_array, 22)[0]
 
-    log.info("The Offset Array Offset is: {0:d}".format(Offset_Array_Offset));
+    log.info("The Offset Array Offset is: %d", Offset_Array_Offset)
 
     #Returen the Offset_Array_Offset byte length and its value
-    return Offset_Array_Offset_length, Offset_Array_Offset;
+    return Offset_Array_Offset_length, Offset_Array_Offset
 
 def get_Number_of_Dimensions(byte_array,OffsetArrayOffset_length):
     """Get the Number of dimensions
@@ -147,14 +366,14 @@ def get_Number_of_Dimensions(byte_array,OffsetArrayOffset_length):
     
     :param: OffsetArrayOffset_length is the byte lenghth of the OffsetArrayOffset
     """
-    byte_offset = 22 + OffsetArrayOffset_length;
+    byte_offset = 22 + OffsetArrayOffset_length
 
-    Number_of_Dimensions = int.from_bytes(byte_array[byte_offset:byte_offset+4], 'little');
+    Number_of_Dimensions = _I.unpack_from(byte_array, byte_offset)[0]
 
-    log.info("Number of Dimensions: {0:d}".format(Number_of_Dimensions));
+    log.info("Number of Dimensions: %d", Number_of_Dimensions)
 
     #Return the number of Dimension array dimension
-    return Number_of_Dimensions;
+    return Number_of_Dimensions
 
 #=== Dimension array ===
 def get_Dimension_Size(byte_array,OffsetArrayOffset_length,dim_byte_offset=0):
@@ -166,10 +385,10 @@ def get_Dimension_Size(byte_array,OffsetArrayOffset_length,dim_byte_offset=0):
 
     return:
     """
-    byte_offset = 26 + OffsetArrayOffset_length + dim_byte_offset;
+    byte_offset = 26 + OffsetArrayOffset_length + dim_byte_offset
 
-    N_dimension_size = int.from_bytes(byte_array[byte_offset:byte_offset + 4], 'little');
-    log.info("Number of elements in this Dimension: {0:d}".format(N_dimension_size));
+    N_dimension_size = _I.unpack_from(byte_array, byte_offset)[0]
+    log.info("Number of elements in this Dimension: %d", N_dimension_size)
 
 def get_Calibration_Element(byte_array,OffsetArrayOffset_length,dim_byte_offset=0):
     """Get the Calibration Offset, the Calibration Delta and the Calibration element
@@ -178,16 +397,15 @@ def get_Calibration_Element(byte_array,OffsetArrayOffset_length,dim_byte_offset=
     :params: see above
     :return: 
     """
-    byte_offset = 30 + OffsetArrayOffset_length + dim_byte_offset;
+    byte_offset = 30 + OffsetArrayOffset_length + dim_byte_offset
 
 
-    Calibration_Offset = float(struct.unpack('<d',byte_array[byte_offset:byte_offset + 8])[0]);
-    Calibration_Delta = float(struct.unpack('<d',byte_array[byte_offset + 8:byte_offset + 16])[0]);
-    Calibration_Element = int.from_bytes(byte_array[byte_offset + 16:byte_offset + 20], 'little');
+    #Read all three calibration fields with a single unpack
+    Calibration_Offset, Calibration_Delta, Calibration_Element = _CAL.unpack_from(byte_array, byte_offset)
 
-    log.info("Calibration Element index: {0:d} with Offset {1:.2f} and Delta {2:.2f}".format(Calibration_Element,Calibration_Offset,Calibration_Delta));
+    log.info("Calibration Element index: %d with Offset %.2f and Delta %.2f", Calibration_Element,Calibration_Offset,Calibration_Delta)
 
-    return Calibration_Element,Calibration_Offset,Calibration_Delta;
+    return Calibration_Element,Calibration_Offset,Calibration_Delta
 
 
 def get_Description_Length(byte_array,OffsetArrayOffset_length,dim_byte_offset=0):
@@ -196,13 +414,13 @@ def get_Description_Length(byte_array,OffsetArrayOffset_length,dim_byte_offset=0
     :params: see above
     :return:
     """
-    byte_offset = 50 + OffsetArrayOffset_length + dim_byte_offset;
+    byte_offset = 50 + OffsetArrayOffset_length + dim_byte_offset
 
-    Element_Description_Length = int.from_bytes(byte_array[byte_offset:byte_offset + 4], 'little');
+    Element_Description_Length = _I.unpack_from(byte_array, byte_offset)[0]
 
-    log.info("The length of the element descripction string is {0:d}".format(Element_Description_Length));
+    log.info("The length of the element descripction string is %d", Element_Description_Length)
 
-    return Element_Description_Length;
+    return Element_Description_Length
 
 def get_Element_Description(byte_array,OffsetArrayOffset_length,element_description_length,dim_byte_offset=0):
     """Get the description of the element
@@ -211,13 +429,17 @@ def get_Element_Description(byte_array,OffsetArrayOffset_length,element_descript
     :param element_description_length: the output of the get_description_length function
     :return:
     """
-    byte_offset = 54 + OffsetArrayOffset_length + dim_byte_offset;
+    byte_offset = 54 + OffsetArrayOffset_length + dim_byte_offset
+
+    #Slice through a memoryview so no intermediate bytes object is
+    #allocated before decoding
+    mv = byte_array if isinstance(byte_array, memoryview) else memoryview(byte_array)
 
-    Element_Descrition = str(byte_array[byte_offset:byte_offset + element_description_length], 'utf-8');
+    Element_Descrition = str(mv[byte_offset:byte_offset + element_description_length], 'utf-8')
 
-    log.info("Element descrition:\n{0:s}".format(Element_Descrition));
+    log.info("Element descrition:\n%s", Element_Descrition)
 
-    return Element_Descrition;
+    return Element_Descrition
 
 def get_Units_Length(byte_array,OffsetArrayOffset_length,element_description_length,dim_byte_offset=0):
     """Get the length of the Units string of the element
@@ -225,15 +447,13 @@ def get_Units_Length(byte_array,OffsetArrayOffset_length,element_description_len
     :params: see above
     :return:
     """
-    byte_offset = 54 + OffsetArrayOffset_length + element_description_length + dim_byte_offset;
+    byte_offset = 54 + OffsetArrayOffset_length + element_description_length + dim_byte_offset
 
-    print(byte_offset)
+    Element_Units_Length = _I.unpack_from(byte_array, byte_offset)[0]
 
-    Element_Units_Length = int.from_bytes(byte_array[byte_offset:byte_offset + 4], 'little');
+    log.info("The length of the element units string is %d", Element_Units_Length)
 
-    log.info("The length of the element units string is {0:d}".format(Element_Units_Length));
-
-    return Element_Units_Length;
+    return Element_Units_Length
 
 def get_Units_Description(byte_array,OffsetArrayOffset_length,element_description_length,element_units_length,dim_byte_offset=0):
     """Get the units description string for the element
@@ -243,50 +463,87 @@ def get_Units_Description(byte_array,OffsetArrayOffset_length,element_descriptio
     :return:
     """
     if element_units_length == 0:
-        log.info("No associated unit string for this element!");
+        log.info("No associated unit string for this element!")
 
-        return None;
+        return None
     else:
-        byte_offset = 58 + OffsetArrayOffset_length + element_description_length + dim_byte_offset;
+        byte_offset = 58 + OffsetArrayOffset_length + element_description_length + dim_byte_offset
 
-        Element_Units = str(byte_array[byte_offset:byte_offset + element_units_length], 'utf-8');
+        #Slice through a memoryview so no intermediate bytes object is
+        #allocated before decoding
+        mv = byte_array if isinstance(byte_array, memoryview) else memoryview(byte_array)
 
-        log.info("Element units descrition:\n{0:s}".format(Element_Units));
+        Element_Units = str(mv[byte_offset:byte_offset + element_units_length], 'utf-8')
 
-        return Element_Units;
+        log.info("Element units descrition:\n%s", Element_Units)
 
-def get_Data_Offset_Array(byte_array,OffsetArrayOffset,SeriesVersion,TotalNumberOfElements):
-    """Return a list of the byte offest for each individual elements in
-    the TotalNumber of elements array
+        return Element_Units
 
-    :param byte_array :
-    :param OffsetArrayOffset: the second output of the get_Offset_Array_Offset() function
-    :param SeriesVersion: the series version
-    :param TotalNumberOfElements: equals to the dimensions
+def get_Offset_Arrays(byte_array,OffsetArrayOffset,SeriesVersion,TotalNumberOfElements):
+    """Read the data and tag offset tables with a single call
 
-    :return:
+    The two tables are packed back-to-back, so both are pulled with
+    one np.frombuffer of 2 x TotalNumberOfElements entries and split
+    into the data and tag halves (both are zero-copy views).
+
+    :params: see get_Data_Offset_Array()
+
+    :return: (DataOffsetArray, TagOffsetArray)
+    """
+    #Get the offset width for this series version
+    offset_dtype = _OAO_DTYPE[_OAO_LEN[SeriesVersion]]
+
+    offset_tables = np.frombuffer(byte_array,dtype=offset_dtype,
+            count=2 * TotalNumberOfElements,offset=OffsetArrayOffset)
+
+    return offset_tables[:TotalNumberOfElements], offset_tables[TotalNumberOfElements:]
+
+def get_Dimension_Header(byte_array,OffsetArrayOffset_length,dim_byte_offset=0):
+    """Read a whole dimension array element in a single pass
+
+    One structured np.frombuffer read pulls all the fixed fields
+    (dimension size, calibration offset/delta/element and the
+    description length) instead of a separate getter call per field;
+    the variable-length description and units strings are then sliced
+    out with the now-known lengths.
+
+    :params: see above
+
+    :return: (record, units_length, description, units) where record
+        holds the fields of _DIM_HDR_DT
     """
+    byte_offset = 26 + OffsetArrayOffset_length + dim_byte_offset
+
+    record = np.frombuffer(byte_array,dtype=_DIM_HDR_DT,count=1,offset=byte_offset)[0]
 
-    DataOffsetArray = np.zeros(TotalNumberOfElements,dtype=int)
+    element_description_length = int(record['desc_len'])
 
-    #Check series version
-    if SeriesVersion == "0x210":
-        OffsetArrayOffset_length = int(4)
-    elif SeriesVersion == "0x220":
-        OffsetArrayOffset_length = int(8)
+    #Both strings are sliced and decoded in place with a single
+    #memoryview instead of re-deriving the offsets in the per-field
+    #getters (the length fields count bytes, so the slice bounds
+    #follow directly)
+    mv = byte_array if isinstance(byte_array, memoryview) else memoryview(byte_array)
 
-    byte_offset = OffsetArrayOffset_length;
+    description_offset = byte_offset + 28 #the fixed fields of the dimension element
+    Element_Descrition = str(mv[description_offset:description_offset + element_description_length], 'utf-8')
 
-    #Loop through all elements (dimensions)
-    for NElement in range(0,TotalNumberOfElements):
+    log.info("Element descrition:\n%s", Element_Descrition)
 
-        DataOffsetArray[NElement] = int.from_bytes(byte_array[OffsetArrayOffset:OffsetArrayOffset+byte_offset], 'little');
+    units_length_offset = description_offset + element_description_length
+    Element_Units_Length = _I.unpack_from(byte_array, units_length_offset)[0]
 
-        byte_offset += OffsetArrayOffset_length;
+    if Element_Units_Length == 0:
+        log.info("No associated unit string for this element!")
+        Element_Units = None
+    else:
+        units_offset = units_length_offset + 4
+        Element_Units = str(mv[units_offset:units_offset + Element_Units_Length], 'utf-8')
+
+        log.info("Element units descrition:\n%s", Element_Units)
 
-    return DataOffsetArray;
+    return record, Element_Units_Length, Element_Descrition, Element_Units
 
-def get_Tag_Offset_Array(byte_array,OffsetArrayOffset,SeriesVersion,TotalNumberOfElements,DataOffsetArray_length):
+def get_Data_Offset_Array(byte_array,OffsetArrayOffset,SeriesVersion,TotalNumberOfElements):
     """Return a list of the byte offest for each individual elements in
     the TotalNumber of elements array
 
@@ -294,31 +551,42 @@ def get_Tag_Offset_Array(byte_array,OffsetArrayOffset,SeriesVersion,TotalNumberO
     :param OffsetArrayOffset: the second output of the get_Offset_Array_Offset() function
     :param SeriesVersion: the series version
     :param TotalNumberOfElements: equals to the dimensions
-    :param DataOffsetArray_length: the lenght of the array outputted from get_Data_Offset_Array()
 
     :return:
     """
-    TagOffsetArray = np.zeros(TotalNumberOfElements,dtype=int)
 
-    #Check series version
-    if SeriesVersion == "0x210":
-        OffsetArrayOffset_length = int(4)
-    elif SeriesVersion == "0x220":
-        OffsetArrayOffset_length = int(8)
+    #Get the offset width for this series version
+    offset_dtype = _OAO_DTYPE[_OAO_LEN[SeriesVersion]]
+
+    #The offset table is a packed array so it can be read with a
+    #single C-level call instead of a Python loop
+    DataOffsetArray = np.frombuffer(byte_array,dtype=offset_dtype,
+            count=TotalNumberOfElements,offset=OffsetArrayOffset)
 
-    byte_offset_start = OffsetArrayOffset + (DataOffsetArray_length * OffsetArrayOffset_length)
-    byte_offset =  OffsetArrayOffset_length
+    return DataOffsetArray
 
-    #print(OffsetArrayOffset,byte_offset_start,byte_offset_start+byte_offset)
+def get_Tag_Offset_Array(byte_array,OffsetArrayOffset,SeriesVersion,TotalNumberOfElements):
+    """Return a list of the byte offest for each individual elements in
+    the TotalNumber of elements array
+
+    :param byte_array :
+    :param OffsetArrayOffset: the second output of the get_Offset_Array_Offset() function
+    :param SeriesVersion: the series version
+    :param TotalNumberOfElements: equals to the dimensions
 
-    #Loop through all elements (dimensions)
-    for NElement in range(0,TotalNumberOfElements):
+    :return:
+    """
+    #Get the offset width for this series version
+    offset_dtype = _OAO_DTYPE[_OAO_LEN[SeriesVersion]]
 
-        TagOffsetArray[NElement] = int.from_bytes(byte_array[byte_offset_start:byte_offset_start+byte_offset], 'little');
+    #The tag offset table is packed right after the data offset
+    #table, which holds TotalNumberOfElements entries as well
+    byte_offset_start = OffsetArrayOffset + (TotalNumberOfElements * np.dtype(offset_dtype).itemsize)
 
-        byte_offset += OffsetArrayOffset_length;
+    TagOffsetArray = np.frombuffer(byte_array,dtype=offset_dtype,
+            count=TotalNumberOfElements,offset=byte_offset_start)
 
-    return TagOffsetArray;
+    return TagOffsetArray
 
 def get_TimeOnlyTag(byte_array,TagOffset,TagTypeID):
     """Return the time stamp of the data
@@ -330,13 +598,14 @@ def get_TimeOnlyTag(byte_array,TagOffset,TagTypeID):
     :return:
     """
 
-    tag_type_ID = hex(int.from_bytes(byte_array[TagOffset:TagOffset + 4], 'little'))#Two rouge byte at the end, but does nor matter
+    tag_type_ID = _I.unpack_from(byte_array, TagOffset)[0]#Two rouge byte at the end, but does nor matter
 
-    assert tag_type_ID == TagTypeID, "Invalid Tag Type ID: {0:s} (not {1:s})!".format(tag_type_ID,TagTypeID)
+    if tag_type_ID != TagTypeID:
+        raise ValueError("Invalid Tag Type ID: {0:s} (not {1:s})!".format(hex(tag_type_ID),hex(TagTypeID)))
 
-    time_stamp = int.from_bytes(byte_array[TagOffset + 4:TagOffset + 8], 'little');
+    time_stamp = _I.unpack_from(byte_array, TagOffset + 4)[0]
 
-    return time_stamp;
+    return time_stamp
 
 def get_Time_and_PositionTag(byte_array,TagOffset,TagTypeID):
     """Return the time stamp and the position tags of the data
@@ -348,16 +617,70 @@ def get_Time_and_PositionTag(byte_array,TagOffset,TagTypeID):
     :return:
     """
 
-    tag_type_ID = hex(int.from_bytes(byte_array[TagOffset:TagOffset + 4], 'little'))#Two rouge byte at the end, but does nor matter
+    tag_type_ID = _I.unpack_from(byte_array, TagOffset)[0]#Two rouge byte at the end, but does nor matter
+
+    if tag_type_ID != TagTypeID:
+        raise ValueError("Invalid Tag Type ID: {0:s} (not {1:s})!".format(hex(tag_type_ID),hex(TagTypeID)))
+
+    time_stamp = _I.unpack_from(byte_array, TagOffset + 4)[0]
+
+    position_X = _D.unpack_from(byte_array, TagOffset + 8)[0]
+    position_Y = _D.unpack_from(byte_array, TagOffset + 16)[0]
 
-    assert tag_type_ID == TagTypeID, "Invalid Tag Type ID: {0:s} (not {1:s})!".format(tag_type_ID,TagTypeID)
+    return time_stamp,position_X,position_Y
+
+def get_Tag_Stream(byte_array,TagOffsetArray,TagTypeID):
+    """Read the tags of every element as one structured (SoA) array
+
+    When the tags are packed back-to-back in the file -- the common
+    case -- the whole tag stream is read with a single np.frombuffer
+    call. When the tags are evenly spaced but padded (constant stride
+    larger than the record) the stream is read through a strided view
+    and compacted in one C-level pass. Only irregularly placed tags
+    fall back to a per-element gather into a preallocated structured
+    array. Either way the result exposes the columns as vectorized
+    arrays ('tid', 'ts' and for position tags 'x', 'y') instead of N
+    per-element Python calls.
+
+    :param byte_array:
+    :param TagOffsetArray: the output of get_Tag_Offset_Array()
+    :param TagTypeID: the Tag Type ID gained from the header
 
-    time_stamp = int.from_bytes(byte_array[TagOffset + 4:TagOffset + 8], 'little');
+    :return: a structured numpy array with one record per element
+    """
+    if TagTypeID == _TAG_TYPE_TIME:
+        tag_dtype = _TAG_DT_TIME
+    elif TagTypeID == _TAG_TYPE_TIME_AND_POSITION:
+        tag_dtype = _TAG_DT_POS
+    else:
+        raise ValueError("Invalid tag type ID: {0:s}".format(hex(TagTypeID)))
+
+    N_elements = np.size(TagOffsetArray)
+
+    #Check if the tag stream is contiguous or at least evenly strided
+    tag_strides = np.diff(TagOffsetArray)
+    if N_elements < 2 or np.all(tag_strides == tag_dtype.itemsize):
+        tag_stream = np.frombuffer(byte_array,dtype=tag_dtype,
+                count=N_elements,offset=int(TagOffsetArray[0]))
+    elif np.ptp(tag_strides) == 0:
+        #Evenly spaced but padded records: view the stream with the
+        #on-disk stride, then compact it with a single copy
+        tag_stream = np.ascontiguousarray(np.ndarray((N_elements,),dtype=tag_dtype,
+                buffer=byte_array,offset=int(TagOffsetArray[0]),
+                strides=(int(tag_strides[0]),)))
+    else:
+        #Gather the tags one-by-one into a preallocated array
+        tag_stream = np.empty(N_elements,dtype=tag_dtype)
+        for NElement in range(0,N_elements):
+            tag_stream[NElement] = np.frombuffer(byte_array,dtype=tag_dtype,
+                    count=1,offset=int(TagOffsetArray[NElement]))[0]
 
-    position_X = float(struct.unpack('<d',byte_array[TagOffset + 8:TagOffset + 16])[0]);
-    position_Y = float(struct.unpack('<d',byte_array[TagOffset + 16:TagOffset + 16])[0]);
+    #Validate all tag type IDs with one vectorized compare
+    if not np.all(tag_stream['tid'] == TagTypeID):
+        invalid_tid = tag_stream['tid'][tag_stream['tid'] != TagTypeID][0]
+        raise ValueError("Invalid Tag Type ID: {0:s} (not {1:s})!".format(hex(int(invalid_tid)),hex(TagTypeID)))
 
-    return time_stamp,position_X,position_Y;
+    return tag_stream
 
 def get_1DdataElementHeader(byte_array,DataOffset,DataTypeID,TagTypeID):
     """Get the 1D data from the data element array for a single element
@@ -372,28 +695,18 @@ def get_1DdataElementHeader(byte_array,DataOffset,DataTypeID,TagTypeID):
     :return:
     """
 
-    #=== This seems to be unnecessary ===
-    #Get the full offset based on the tag type that is befor the data element
-    #Okay here it should be the tag array...
-    if TagTypeID == "0x4152":
-        #byte_offset = DataOffset + 8
-        byte_offset = DataOffset + 0
-    elif TagTypeID == "0x4142":
-        #byte_offset = DataOffset + 24
-        byte_offset = DataOffset + 0
-    #====================================
+    #The data element header starts right at DataOffset regardless of
+    #the tag type (the tags live in their own array), so no per-tag
+    #offset correction is needed
+    byte_offset = DataOffset
 
-    Calibration_Offset = float(struct.unpack('<d',byte_array[byte_offset:byte_offset + 8])[0]);
-    Calibration_Delta = float(struct.unpack('<d',byte_array[byte_offset + 8:byte_offset + 16])[0]);
-    Calibration_Element = int.from_bytes(byte_array[byte_offset + 16:byte_offset + 20], 'little');
-
-    DataType = int(struct.unpack('<H',byte_array[byte_offset + 20:byte_offset + 22])[0]);
-
-    Data_Array_Size = int.from_bytes(byte_array[byte_offset + 22:byte_offset + 26], 'little');
+    #Read all fixed header fields with a single unpack
+    Calibration_Offset, Calibration_Delta, Calibration_Element, \
+    DataType, Data_Array_Size = _HDR_1D.unpack_from(byte_array, byte_offset)
 
     return Calibration_Offset, Calibration_Delta, Calibration_Element, DataType, Data_Array_Size
 
-def get_2DdataElementData(byte_array,DataOffset,DataTypeID,DataType,DataSize):
+def get_1DdataElementData(byte_array,DataOffset,DataTypeID,DataType,DataSize):
     """Get the actual data of the Element
 
     :param byte_array:
@@ -401,20 +714,21 @@ def get_2DdataElementData(byte_array,DataOffset,DataTypeID,DataType,DataSize):
     :param DataTypeID: the Data Type ID gained from the header
     :param DataType: theencoding type of the data as described in the documentation
     :param DataSize: the lenght of the data in the only axis
-    
-    :return:
+
+    :return: a zero-copy view of the mapped file bytes -- it is
+        read-only, callers that need to mutate must .copy() first
     """
 
     byte_offset = DataOffset + 26
 
-    #Get the data length => need a different function to generate this
-    if DataType == 2:
-        Data_Array_byte_Size = DataSizeX * DataSizeY * 2;
+    #Get the data encoding from the dispatch table
+    data_dtype = _TIA_DTYPE[DataType]
 
-    #Read in as a single tuple (!) but I convert it to a numpy array with np.asarray()
-    Image_Array = np.asarray(struct.unpack("<{0:d}H".format(DataSize),byte_array[byte_offset:byte_offset + Data_Array_byte_Size]))
+    #Read the data block with a single C-level call instead of
+    #unpacking every value into an intermediate Python tuple
+    Data_Array = np.frombuffer(byte_array,dtype=data_dtype,count=DataSize,offset=byte_offset)
 
-    return Image_Array
+    return Data_Array
 
 def get_2DdataElementHeader(byte_array,DataOffset,DataTypeID,TagTypeID):
     """Get the 2D data from the data element array for a single element
@@ -429,36 +743,24 @@ def get_2DdataElementHeader(byte_array,DataOffset,DataTypeID,TagTypeID):
     :return:
     """
 
-    #=== This seems to be unnecessary ===
-    #Get the full offset based on the tag type that is befor the data element
-    #Okay here it should be the tag array...
-    if TagTypeID == "0x4152":
-        #byte_offset = DataOffset + 8
-        byte_offset = DataOffset + 0
-    elif TagTypeID == "0x4142":
-        #byte_offset = DataOffset + 24
-        byte_offset = DataOffset + 0
-    #====================================
-
-    Calibration_Offset_X = float(struct.unpack('<d',byte_array[byte_offset:byte_offset + 8])[0]);
-    Calibration_Delta_X = float(struct.unpack('<d',byte_array[byte_offset + 8:byte_offset + 16])[0]);
-    Calibration_Element_X = int.from_bytes(byte_array[byte_offset + 16:byte_offset + 20], 'little');
-
-    Calibration_Offset_Y = float(struct.unpack('<d',byte_array[byte_offset + 20:byte_offset + 28])[0]);
-    Calibration_Delta_Y = float(struct.unpack('<d',byte_array[byte_offset + 28:byte_offset + 36])[0]);
-    Calibration_Element_Y = int.from_bytes(byte_array[byte_offset + 36:byte_offset + 40], 'little');
-
-    #The data offset and delta should be the same in the xy direction
-    assert Calibration_Offset_X == Calibration_Offset_Y, "The calibration offset is different ({0:e},{1:e}) for the x and y directions!".format(
-            Calibration_Offset_X,Calibration_Offset_Y)
+    #The data element header starts right at DataOffset regardless of
+    #the tag type (the tags live in their own array), so no per-tag
+    #offset correction is needed
+    byte_offset = DataOffset
 
-    assert Calibration_Delta_X == Calibration_Delta_Y, "The calibration delta is different ({0:e},{1:e}) for the x and y directions!".format(
-            Calibration_Delta_X,Calibration_Delta_Y)
+    #Read all fixed header fields with a single unpack
+    Calibration_Offset_X, Calibration_Delta_X, Calibration_Element_X, \
+    Calibration_Offset_Y, Calibration_Delta_Y, Calibration_Element_Y, \
+    DataType, Data_Array_Size_X, Data_Array_Size_Y = _HDR_2D.unpack_from(byte_array, byte_offset)
 
-    DataType = int(struct.unpack('<H',byte_array[byte_offset + 40:byte_offset + 42])[0]);
+    #The data offset and delta should be the same in the xy direction
+    if Calibration_Offset_X != Calibration_Offset_Y:
+        raise ValueError("The calibration offset is different ({0:e},{1:e}) for the x and y directions!".format(
+                Calibration_Offset_X,Calibration_Offset_Y))
 
-    Data_Array_Size_X = int.from_bytes(byte_array[byte_offset + 42:byte_offset + 46], 'little');
-    Data_Array_Size_Y = int.from_bytes(byte_array[byte_offset + 46:byte_offset + 50], 'little');
+    if Calibration_Delta_X != Calibration_Delta_Y:
+        raise ValueError("The calibration delta is different ({0:e},{1:e}) for the x and y directions!".format(
+                Calibration_Delta_X,Calibration_Delta_Y))
 
     return Calibration_Offset_X, Calibration_Offset_Y, \
             Calibration_Delta_X, Calibration_Delta_Y, \
@@ -475,56 +777,192 @@ def get_2DdataElementData(byte_array,DataOffset,DataTypeID,DataType,DataSizeX,Da
     :param DataType: theencoding type of the data as described in the documentation
     :param DataSizeX: the lenght of the data in the X axis (N pixel)
     :param DataSizeY: the lenght of the data in the Y axis (N pixel)
-    
-    :return:
+
+    :return: a zero-copy 2D view of the mapped file bytes -- it is
+        read-only, callers that need to mutate must .copy() first
     """
 
     byte_offset = DataOffset + 50
 
-    #Get the data length => need a different function to generate this
-    if DataType == 2:
-        Data_Array_byte_Size = DataSizeX * DataSizeY * 2;
+    #Get the data encoding from the dispatch table
+    data_dtype = _TIA_DTYPE[DataType]
 
-    #Read in as a single tuple (!) but I convert it to a numpy array with np.asarray()
-    Image_Array = np.asarray(struct.unpack("<{0:d}H".format(DataSizeX * DataSizeY),byte_array[byte_offset:byte_offset + Data_Array_byte_Size]))
+    #Read the data block with a single C-level call instead of
+    #unpacking every pixel into an intermediate Python tuple and
+    #return it reshaped as a 2D image (the reshape is a free view)
+    Image_Array = np.frombuffer(byte_array,dtype=data_dtype,
+            count=DataSizeX * DataSizeY,offset=byte_offset).reshape(DataSizeY,DataSizeX)
 
     return Image_Array
 
-def save_2DdataElemwntAsImage(ImageArray,DataSizeX,DataSizeY,OffsetValue,DeltaValue,ElementIndexX,ElementIndexY,OutputName):
+if _HAVE_NUMBA:
+    #Deliberately not parallel=True: the kernel is invoked from the
+    #image-save thread pool and numba's default threading layer does
+    #not support concurrent calls into a parallel region -- the
+    #parallelism comes from the pool running one frame per thread
+    @njit(fastmath=True, cache=True)
+    def _calibrate_stack(ImageStack,ElementIndexX,ElementIndexY,OffsetValue,DeltaValue,out):
+        for k in range(ImageStack.shape[0]):
+            #The images are row-major (Y,X) views so y indexes first
+            reference_value = np.float32(ImageStack[k,ElementIndexY,ElementIndexX])
+            for i in range(ImageStack.shape[1]):
+                for j in range(ImageStack.shape[2]):
+                    out[k,i,j] = OffsetValue + ((np.float32(ImageStack[k,i,j]) - reference_value) * DeltaValue)
+else:
+    def _calibrate_stack(ImageStack,ElementIndexX,ElementIndexY,OffsetValue,DeltaValue,out):
+        for k in range(ImageStack.shape[0]):
+            #The images are row-major (Y,X) views so y indexes first
+            reference_value = np.float32(ImageStack[k,ElementIndexY,ElementIndexX])
+
+            #Run the scaling through in-place ufuncs writing straight
+            #into the float32 output, so neither an .astype copy nor
+            #a float64 temporary is allocated
+            np.subtract(ImageStack[k], reference_value, out=out[k], casting='unsafe')
+            np.multiply(out[k], DeltaValue, out=out[k])
+            np.add(out[k], OffsetValue, out=out[k])
+
+def calibrate_stack(ImageStack,ElementIndexX,ElementIndexY,OffsetValue,DeltaValue):
+    """Apply the calibration scaling to a stack of image elements
+
+    Computes Offset + (pixel - reference) * Delta for every pixel of
+    every image in the stack. With numba installed a JIT-compiled
+    kernel is used; otherwise a numpy broadcast per image. Either way
+    the function is safe to call from several threads at once.
+
+    :param ImageStack: (N,Y,X) shaped array of the raw image elements
+    :param ElementIndexX: the x index of the reference pixel
+    :param ElementIndexY: the y index of the reference pixel
+    :param OffsetValue: the offset of the reference pixel
+    :param DeltaValue: the offset of the incremet
+
+    :return: the calibrated stack as float32
+    """
+    calibrated_stack = np.empty(ImageStack.shape, dtype=np.float32)
+
+    _calibrate_stack(ImageStack,ElementIndexX,ElementIndexY,
+            np.float32(OffsetValue),np.float32(DeltaValue),calibrated_stack)
+
+    return calibrated_stack
+
+def get_2DdataElementMeta(byte_array,DataOffsetArray):
+    """Read the 2D element headers of the whole series in bulk
+
+    With regularly spaced elements -- the common case -- all headers
+    are pulled through a single strided view of the mapped file, so
+    the per-frame decode happens in one C-level pass. Otherwise each
+    record is gathered through the offset table into a preallocated
+    structured array.
+
+    :param byte_array:
+    :param DataOffsetArray: the output of get_Data_Offset_Array()
+
+    :return: an (N,) structured array with the _META_2D_DT fields
+    """
+    N_elements = np.size(DataOffsetArray)
+
+    if N_elements > 1:
+        element_strides = np.diff(DataOffsetArray)
+
+        if np.ptp(element_strides) == 0:
+            meta_view = np.ndarray((N_elements,),dtype=_META_2D_DT,buffer=byte_array,
+                    offset=int(DataOffsetArray[0]),strides=(int(element_strides[0]),))
+
+            #Compact the strided view into a contiguous array
+            return np.ascontiguousarray(meta_view)
+
+    data_element_meta = np.empty(N_elements,dtype=_META_2D_DT)
+
+    for NElement in range(0,N_elements):
+        data_element_meta[NElement] = np.frombuffer(byte_array,_META_2D_DT,1,int(DataOffsetArray[NElement]))[0]
+
+    return data_element_meta
+
+def get_Data_Stack(byte_array,DataOffsetArray,DataType,DataSizeX,DataSizeY):
+    """Build an (N,Y,X) stack of every 2D element in the series
+
+    For an image series all frames share the same shape and encoding.
+    When the element offsets are regularly spaced -- the common case
+    -- the whole stack is a single strided, zero-copy view into the
+    mapped file. Otherwise a contiguous stack is preallocated once
+    and every frame is blitted into its slot, which still avoids
+    growing a Python list of per-frame arrays.
+
+    :param byte_array:
+    :param DataOffsetArray: the output of get_Data_Offset_Array()
+    :param DataType: the encoding type from the element header
+    :param DataSizeX: the lenght of the data in the X axis (N pixel)
+    :param DataSizeY: the lenght of the data in the Y axis (N pixel)
+
+    :return: the (N,Y,X) shaped stack
+    """
+    N_elements = np.size(DataOffsetArray)
+    px_dtype = np.dtype(_TIA_DTYPE[DataType])
+
+    if N_elements == 1:
+        return get_2DdataElementData(byte_array,int(DataOffsetArray[0]),
+                _DATA_TYPE_2D,DataType,DataSizeX,DataSizeY)[np.newaxis,...]
+
+    element_strides = np.diff(DataOffsetArray)
+
+    if np.ptp(element_strides) == 0:
+        #Regular spacing: alias the file as one strided 3D view
+        data_stack = np.ndarray((N_elements,DataSizeY,DataSizeX),dtype=px_dtype,
+                buffer=byte_array,offset=int(DataOffsetArray[0]) + 50,
+                strides=(int(element_strides[0]),DataSizeX * px_dtype.itemsize,px_dtype.itemsize))
+    else:
+        #Irregular spacing: blit each frame into a preallocated stack
+        data_stack = np.empty((N_elements,DataSizeY,DataSizeX),dtype=px_dtype)
+
+        for NElement in range(0,N_elements):
+            data_stack[NElement] = get_2DdataElementData(byte_array,int(DataOffsetArray[NElement]),
+                    _DATA_TYPE_2D,DataType,DataSizeX,DataSizeY)
+
+    return data_stack
+
+def save_2DdataElemwntAsImage(ImageArray,DataSizeX,DataSizeY,OffsetValue,DeltaValue,ElementIndexX,ElementIndexY,OutputName,GlobalMin=None,GlobalMax=None):
     """Save a 2D image element with some default settings
 
-    :param ImageArray: the 1D (!) Image array that is the output of the get_2DdataElementData()
+    :param ImageArray: the 2D Image array that is the output of the get_2DdataElementData()
     :param DataSizeX: the lenght of the data in the X axis (N pixel)
     :param DataSizeY: the lenght of the data in the Y axis (N pixel)
     :param OffsetValue: the offset of the reference pixel
     :param DeltaValue: the offset of the incremet
     :param ElementIndexX: the x index of the reference pixel
     :param ElementIndexY: the y index of the reference pixel
-    :param OutputName: the name of the output file 
+    :param OutputName: the name of the output file
+    :param GlobalMin: the raw global minimum of the whole series (optional)
+    :param GlobalMax: the raw global maximum of the whole series (optional)
 
     :return :
     """
-    #Reshape it into an image
-    ImageArray = ImageArray.reshape(DataSizeX,DataSizeY);
-
-    #Cange the image type to float
-    ImageArray = ImageArray.astype(float)
-
-    #Sacle with the offset
-    Calibration_Element_Value = ImageArray[ElementIndexX,ElementIndexY];
-    #ImageArray[ElementIndexX,ElementIndexY] = OffsetValue #I assume this
+    #Keep the raw reference pixel for mapping the global bounds below
+    reference_value = float(ImageArray[ElementIndexY,ElementIndexX])
+
+    #Scale everything with the offset through the (possibly JIT
+    #compiled) calibration kernel; a single image is a stack of one
+    ImageArray = calibrate_stack(ImageArray[np.newaxis,...],
+            ElementIndexX,ElementIndexY,OffsetValue,DeltaValue)[0]
+
+    if GlobalMin is None or GlobalMax is None:
+        #Fall back to matplotlib's per-frame autoscale
+        vmin = None
+        vmax = None
+    else:
+        #Map the raw global bounds through the same calibration so
+        #every frame of the series is encoded on a common intensity
+        #scale without a per-frame min/max scan
+        bound_low = OffsetValue + ((GlobalMin - reference_value) * DeltaValue)
+        bound_high = OffsetValue + ((GlobalMax - reference_value) * DeltaValue)
 
-    #Scale everything with the offset
-    for i in range(0,DataSizeX):
-        for j in range(0,DataSizeX):
-            ImageArray[i,j] = OffsetValue + ((ImageArray[i,j] - Calibration_Element_Value) * DeltaValue)
+        vmin = min(bound_low,bound_high)
+        vmax = max(bound_low,bound_high)
 
     #Plot
     #plt.matshow(Image_format,cmap='gray',origin='lower') 
 
     #Save the array onlya s an image
     #plt.imsave(OutputName,ImageArray,cmap='viridis',origin='lower')
-    plt.imsave(OutputName,ImageArray,cmap='gray',origin='lower')
+    plt.imsave(OutputName,ImageArray,cmap='gray',origin='lower',vmin=vmin,vmax=vmax)
     
     #This can also do eg .eps !
 
@@ -541,86 +979,89 @@ if __name__ == '__main__':
     """Create combined image plots
     """
     #Setup logging
-    log = logging.getLogger(__name__);
-    log.setLevel(logging.INFO);
-    log.addHandler(logging.StreamHandler(sys.stdout));
+    log = logging.getLogger(__name__)
+    log.setLevel(logging.INFO)
+    log.addHandler(logging.StreamHandler(sys.stdout))
 
     #=== File to rad in ===
-    #input_file = './14.41.47 Scanning Acquire_1.ser';
+    #input_file = './14.41.47 Scanning Acquire_1.ser'
     input_file = './14.23.42 Scanning Acquire_1.ser'
 
-    #=== Read in the binary file as strings ===
-    with open(input_file, mode='rb') as file: # b is important -> binary
-        image_byte_array = file.read()
-
-    file.close();
+    #=== Memory-map the binary file ===
+    image_byte_array = open_ser(input_file)
 
     #=== Work with the header ===
-    log.info("Reafing in .SER file: {0:s}".format(input_file));
+    log.info("Reafing in .SER file: %s", input_file)
+
+    log.info("Reading the header in...")
+    ser_header = parse_header(image_byte_array)
 
-    log.info("Reading the header in...");
-    series_version = check_series_ID_and_Version(image_byte_array);
-    data_type_ID, tag_type_ID = get_data_and_tag_ID(image_byte_array);
-    get_total_and_valid_element_num(image_byte_array);
-    offset_array_offset_length, offset_array_offset = get_Offset_Array_Offset(image_byte_array, series_version);
-    N_Dimensions = get_Number_of_Dimensions(image_byte_array,offset_array_offset_length);
-    log.info("...done.");
+    series_version = ser_header.series_version
+    data_type_ID = ser_header.data_type_id
+    tag_type_ID = ser_header.tag_type_id
+    offset_array_offset_length = ser_header.oao_len
+    offset_array_offset = ser_header.offset_array_offset
+    N_Dimensions = ser_header.n_dimensions
+    log.info("...done.")
 
     #=== Work with the dimension array ===
-    log.info("Reading the Dimension Array format...");
-    DM_offset = 0;#The dimension array offset for the Nth element
+    log.info("Reading the Dimension Array format...")
+    DM_offset = 0 #The dimension array offset for the Nth element
     
-    calibration_element_list = np.zeros(N_Dimensions,dtype=int);
-    calibration_offset_list = np.zeros(N_Dimensions,dtype=float);
-    calibration_delta_list = np.zeros(N_Dimensions,dtype=float);
+    #The integer fields are 4 (or 2) bytes in the file, so store them
+    #at their native width instead of letting numpy default to int64
+    calibration_element_list = np.zeros(N_Dimensions,dtype=np.uint32)
+    calibration_offset_list = np.zeros(N_Dimensions,dtype=float)
+    calibration_delta_list = np.zeros(N_Dimensions,dtype=float)
 
-    description_lenghth_list = np.zeros(N_Dimensions,dtype=int);
-    element_description_list = [];
+    #The string lists are pre-sized object arrays indexed by ND, so
+    #there is no list realloc while the loop grows them
+    description_lenghth_list = np.zeros(N_Dimensions,dtype=np.uint32)
+    element_description_list = np.empty(N_Dimensions,dtype=object)
 
-    units_length_list = np.zeros(N_Dimensions,dtype=int);
-    units_description_list = [];
+    units_length_list = np.zeros(N_Dimensions,dtype=np.uint32)
+    units_description_list = np.empty(N_Dimensions,dtype=object)
 
     for ND in range(0,N_Dimensions):
-        log.info("Dimension no {0:d}...".format(ND));
-        get_Dimension_Size(image_byte_array,offset_array_offset_length,DM_offset);
-        calibration_element_list[ND], calibration_offset_list[ND], calibration_delta_list[ND] = \
-        get_Calibration_Element(image_byte_array,offset_array_offset_length,DM_offset);
-        description_lenghth_list[ND] = get_Description_Length(image_byte_array,offset_array_offset_length,DM_offset);
-        element_description_list.append(get_Element_Description(image_byte_array,offset_array_offset_length,description_lenghth_list[ND],DM_offset));
-        units_length_list[ND] = get_Units_Length(image_byte_array,offset_array_offset_length,description_lenghth_list[ND],DM_offset);
-        units_description_list.append(get_Units_Description(image_byte_array,offset_array_offset_length,description_lenghth_list[ND],units_length_list[ND],DM_offset));
-
-        DM_offset += description_lenghth_list[ND] + units_length_list[ND];
-        log.info("...done.")
+        log.info("Dimension no %d...", ND)
 
-    dimensions_array_end_byte_offset = 26 + offset_array_offset_length + ((32 * N_Dimensions) + DM_offset);#26 + offset + the length of the dimensions array including all elements
+        #One structured read for all fixed fields plus the two strings
+        dim_record, units_length_list[ND], element_description, element_units = \
+        get_Dimension_Header(image_byte_array,offset_array_offset_length,DM_offset)
 
-    assert dimensions_array_end_byte_offset  == offset_array_offset, \
-    "OffsetArrayOffset ({0:d} bytes) has not beer reached. The dimension array read till {1:d} bytes!".format(offset_array_offset,dimensions_array_end_byte_offset);
+        calibration_element_list[ND] = dim_record['cal_elem']
+        calibration_offset_list[ND] = dim_record['cal_offset']
+        calibration_delta_list[ND] = dim_record['cal_delta']
+        description_lenghth_list[ND] = dim_record['desc_len']
 
-    #Log the Element lists
-    log.info("For each dimensions the respective element, offset, delta, units and description lists:\n{}\n{}\n{}\n{}\n{}".format(
-            calibration_element_list,calibration_offset_list,calibration_delta_list,units_description_list,element_description_list));
+        element_description_list[ND] = element_description
+        units_description_list[ND] = element_units
 
-    log.info("...done.");
+        DM_offset += description_lenghth_list[ND] + units_length_list[ND]
+        log.info("...done.")
 
-    #=== Work with the Data offset array ===
-    log.info("Reading the Data Offset Array format...");
+    dimensions_array_end_byte_offset = 26 + offset_array_offset_length + ((32 * N_Dimensions) + DM_offset) #26 + offset + the length of the dimensions array including all elements
 
-    #Create a list of the byte offset for the individual data elements
-    Data_Offset_Array = get_Data_Offset_Array(image_byte_array,offset_array_offset,series_version,N_Dimensions)
+    if dimensions_array_end_byte_offset != offset_array_offset:
+        raise ValueError("OffsetArrayOffset ({0:d} bytes) has not beer reached. The dimension array read till {1:d} bytes!".format(offset_array_offset,dimensions_array_end_byte_offset))
 
-    log.info("The Data Offset Array:\n{}".format(Data_Offset_Array))
+    #Log the Element lists (stringifying the full arrays is expensive,
+    #so only do it when the INFO level is actually emitted)
+    if log.isEnabledFor(logging.INFO):
+        log.info("For each dimensions the respective element, offset, delta, units and description lists:\n%s\n%s\n%s\n%s\n%s",
+                calibration_element_list,calibration_offset_list,calibration_delta_list,units_description_list,element_description_list)
 
-    log.info("...done")
+    log.info("...done.")
 
-    #=== Work with the Tag offset array ===
-    log.info("Reading the Tag Offset Array format...");
+    #=== Work with the Data and Tag offset arrays ===
+    log.info("Reading the Data and Tag Offset Array format...")
 
-    #Create a list of the byte offset for the individual tage elements
-    Tag_Offset_Array = get_Tag_Offset_Array(image_byte_array,offset_array_offset,series_version,N_Dimensions,np.size(Data_Offset_Array))
+    #Both offset tables come back from one read as zero-copy views
+    Data_Offset_Array, Tag_Offset_Array = get_Offset_Arrays(image_byte_array,offset_array_offset,series_version,N_Dimensions)
 
-    log.info("The Tag Offset Array:\n{}".format(Data_Offset_Array))
+    if log.isEnabledFor(logging.INFO):
+        log.info("The Data Offset Array:\n%s", Data_Offset_Array)
+        log.info("The Tag Offset Array:\n%s", Tag_Offset_Array)
 
     log.info("...done")
 
@@ -628,69 +1069,123 @@ if __name__ == '__main__':
 
     #Initialise variable lists nevertheless there are big redundancies here!
 
-    #Tag
-    time_stamp_list = np.zeros(N_Dimensions,dtype=int)
-    if tag_type_ID == "0x4152":
+    #Tag: read the whole tag stream in one pass as a structured array
+    tag_stream = get_Tag_Stream(image_byte_array,Tag_Offset_Array,tag_type_ID)
+
+    time_stamp_list = tag_stream['ts']
+    if tag_type_ID == _TAG_TYPE_TIME:
         position_tag_list = None
-    elif tag_type_ID == "0x4142":
-        position_tag_list = np.zeros((N_Dimensions,2),dtype=float)
+    elif tag_type_ID == _TAG_TYPE_TIME_AND_POSITION:
+        position_tag_list = np.stack((tag_stream['x'],tag_stream['y']),axis=1)
 
     #Data
-    if data_type_ID == "0x4120":
+    if data_type_ID == _DATA_TYPE_1D:
         data_calibration_offset_list = np.zeros(N_Dimensions,dtype=float)
         data_calibration_delta_list = np.zeros(N_Dimensions,dtype=float)
-        data_calibration_element_list = np.zeros(N_Dimensions,dtype=int)
-        data_type_list = np.zeros(N_Dimensions,dtype=int)#Non redundant info and only 2 bytes in the original data set => numpy increases the size
-        data_array_lenght_list = np.zeros(N_Dimensions,dtype=int)
-        data_array_list = [] #store it in a list format as each element can have a different size
-    elif data_type_ID == "0x4122":
-        data_calibration_offset_list = np.zeros((N_Dimensions,2),dtype=float)
-        data_calibration_delta_list = np.zeros((N_Dimensions,2),dtype=float)
-        data_calibration_element_list = np.zeros((N_Dimensions,2),dtype=int)
-        data_type_list = np.zeros(N_Dimensions,dtype=int)#Non redundant info and only 2 bytes in the original data set => numpy increases the size
-        data_array_lenght_list = np.zeros((N_Dimensions,2),dtype=int)
-        data_array_list = [] #store it in a list format as each element can have a different size
+        data_calibration_element_list = np.zeros(N_Dimensions,dtype=np.uint32)
+        data_type_list = np.zeros(N_Dimensions,dtype=np.uint16)#Only 2 bytes in the original data set, so store it at the native width
+        data_array_lenght_list = np.zeros(N_Dimensions,dtype=np.uint32)
+        data_array_list = np.empty(N_Dimensions,dtype=object) #object array as each element can have a different size
+    elif data_type_ID == _DATA_TYPE_2D:
+        #All per-frame header fields land in one structured array,
+        #read in bulk (a single strided C-level pass when the
+        #elements are regularly spaced)
+        data_element_meta = get_2DdataElementMeta(image_byte_array,Data_Offset_Array)
+
+        #The calibration has to agree between the x and y directions
+        #this is checked vectorized over the whole series
+        if not np.all(data_element_meta['cal_off_x'] == data_element_meta['cal_off_y']):
+            raise ValueError("The calibration offset is different for the x and y directions!")
+        if not np.all(data_element_meta['cal_delta_x'] == data_element_meta['cal_delta_y']):
+            raise ValueError("The calibration delta is different for the x and y directions!")
+
+    #For a 2D series all frames share shape and encoding, so the whole
+    #stack is built up front (a zero-copy strided view of the mapped
+    #file when the elements are regularly spaced)
+    if data_type_ID == _DATA_TYPE_2D:
+        data_stack = get_Data_Stack(image_byte_array,Data_Offset_Array,
+                int(data_element_meta['dtype_id'][0]),int(data_element_meta['w'][0]),int(data_element_meta['h'][0]))
+
+        #One vectorized pass for the global intensity range so the
+        #PNG encoder does not rescan every frame
+        stack_global_min = float(data_stack.min())
+        stack_global_max = float(data_stack.max())
+
+    #PNG encoding is CPU-bound C code that releases the GIL, so the
+    #per-frame saves are submitted to a thread pool and overlap with
+    #parsing the next elements
+    save_executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+    save_future_list = []
 
     log.info("Reading in every element:")
-    for ND in range(0,N_Dimensions):
-        log.info("\tElement no. {0:d}".format(ND))
-
-        #Read Data Tag Array 
-        if tag_type_ID == "0x4152":
-            time_stamp_list[ND] = get_TimeOnlyTag(image_byte_array,Tag_Offset_Array[ND],tag_type_ID)
-            log.info("\tANSI-standard (UNIX) time stamp: {0:d}".format(time_stamp_list[ND]))
-
-        elif tag_type_ID == "0x4142":
-            time_stamp_list[ND], position_tag_list[ND,0], position_tag_list[ND,1] = \
-            get_Time_and_PositionTag(image_byte_array,Tag_Offset_Array[ND],tag_type_ID)
-            log.info("\tANSI-standard (UNIX) time stamp: {0:d}".format(time_stamp_list[ND]))
-
-        a = get_2DdataElementHeader(image_byte_array,Data_Offset_Array[ND],data_type_ID,tag_type_ID)
 
-        #Read Data Element Array
-        if data_type_ID == "0x4120":
-            data_calibration_offset_list[ND], data_calibration_delta_list[ND], data_calibration_element_list[ND], data_type_list[ND], data_array_lenght_list[ND] = get_1DdataElementHeader(image_byte_array,Data_Offset_Array[ND],data_type_ID,tag_type_ID)
-
-            log.info("\tElement calibration element at ({0:d},{1:d}) xy coordinates with {2:e} offest and +\- {3:e} delta".format(
-                    data_calibration_element_list[ND], data_calibration_element_list[ND],data_calibration_offset_list[ND],data_calibration_delta_list[ND]))
-            log.info("\tThe data type is {0:d}".format(data_type_list[ND]))
-            log.info("\tThe element size is {0:d}x{1:d} pixels".format(data_array_lenght_list[ND],data_array_lenght_list[ND]))
-
-            data_array_list.append(get_1DdataElementData(image_byte_array,Data_Offset_Array[ND],data_type_ID,data_type_list[ND],data_array_lenght_list[ND]))
+    #The per-element logs build a handful of strings per iteration,
+    #so the whole block is skipped when INFO is not emitted
+    log_elements = log.isEnabledFor(logging.INFO)
+
+    #The data type ID is invariant over the series, so the per-frame
+    #parse routine is looked up once from a dispatch table instead of
+    #re-testing the ID inside the loop
+    def parse_1D_frame(ND):
+        data_calibration_offset_list[ND], data_calibration_delta_list[ND], data_calibration_element_list[ND], data_type_list[ND], data_array_lenght_list[ND] = get_1DdataElementHeader(image_byte_array,Data_Offset_Array[ND],data_type_ID,tag_type_ID)
+
+        if log_elements:
+            log.info("\tElement calibration element at (%d,%d) xy coordinates with %e offest and +\- %e delta",
+                    data_calibration_element_list[ND], data_calibration_element_list[ND],data_calibration_offset_list[ND],data_calibration_delta_list[ND])
+            log.info("\tThe data type is %d", data_type_list[ND])
+            log.info("\tThe element size is %dx%d pixels", data_array_lenght_list[ND],data_array_lenght_list[ND])
+
+    def parse_2D_frame(ND):
+        if log_elements:
+            #The header fields were already read into data_element_meta
+            log.info("\tElement calibration element at (%d,%d) xy coordinates with %e offest and +\- %e delta",
+                    data_element_meta['cal_elem_x'][ND], data_element_meta['cal_elem_y'][ND],data_element_meta['cal_off_x'][ND],data_element_meta['cal_delta_x'][ND])
+            log.info("\tThe data type is %d", data_element_meta['dtype_id'][ND])
+            log.info("\tThe element size is %dx%d pixels", data_element_meta['w'][ND],data_element_meta['h'][ND])
+
+            log.info("\tQueue image save...")
+        #Every frame gets its own output file: the workers run
+        #concurrently, so sharing one path would interleave writes
+        save_future_list.append(save_executor.submit(save_2DdataElemwntAsImage,
+                data_stack[ND],int(data_element_meta['w'][ND]),int(data_element_meta['h'][ND]),float(data_element_meta['cal_off_x'][ND]),float(data_element_meta['cal_delta_x'][ND]),int(data_element_meta['cal_elem_x'][ND]), int(data_element_meta['cal_elem_y'][ND]),'./test_output_{0:d}.png'.format(ND),
+                stack_global_min,stack_global_max))
+        if log_elements:
+            log.info("\t...done")
 
-        elif data_type_ID == "0x4122":
-            data_calibration_offset_list[ND,0], data_calibration_offset_list[ND,1], data_calibration_delta_list[ND,0], data_calibration_delta_list[ND,1], data_calibration_element_list[ND,0], data_calibration_element_list[ND,1], data_type_list[ND], data_array_lenght_list[ND,0], data_array_lenght_list[ND,1] = get_2DdataElementHeader(image_byte_array,Data_Offset_Array[ND],data_type_ID,tag_type_ID)
+    parse_frame = {_DATA_TYPE_1D:parse_1D_frame,
+            _DATA_TYPE_2D:parse_2D_frame}[data_type_ID]
 
-            log.info("\tElement calibration element at ({0:d},{1:d}) xy coordinates with {2:e} offest and +\- {3:e} delta".format(
-                    data_calibration_element_list[ND,0], data_calibration_element_list[ND,1],data_calibration_offset_list[ND,0],data_calibration_delta_list[ND,0]))
-            log.info("\tThe data type is {0:d}".format(data_type_list[ND]))
-            log.info("\tThe element size is {0:d}x{1:d} pixels".format(data_array_lenght_list[ND,0],data_array_lenght_list[ND,1]))
+    for ND in range(0,N_Dimensions):
+        if log_elements:
+            log.info("\tElement no. %d", ND)
 
-            data_array_list.append(get_2DdataElementData(image_byte_array,Data_Offset_Array[ND],data_type_ID,data_type_list[ND],data_array_lenght_list[ND,0],data_array_lenght_list[ND,1]))
+            #The tags were already read in bulk by get_Tag_Stream()
+            log.info("\tANSI-standard (UNIX) time stamp: %d", time_stamp_list[ND])
 
-            log.info("\tSave image...")
-            save_2DdataElemwntAsImage(data_array_list[ND],data_array_lenght_list[ND,0],data_array_lenght_list[ND,1],data_calibration_offset_list[ND,0],data_calibration_delta_list[ND,0],data_calibration_element_list[ND,0], data_calibration_element_list[ND,1],'./test_output.png')
-            log.info("\t...done")
+        #Read Data Element Array
+        parse_frame(ND)
+
+    if data_type_ID == _DATA_TYPE_1D:
+        #With the headers parsed the data blocks are read in one
+        #batched cold-read pass (fadvise + pread) when every element
+        #shares the same encoding and length -- the common case for a
+        #spectrum series; mixed series fall back to per-element views
+        if np.ptp(data_type_list) == 0 and np.ptp(data_array_lenght_list) == 0:
+            elem_dtype = np.dtype(_TIA_DTYPE[int(data_type_list[0])])
+
+            data_array_list[:] = read_all_elements(input_file,Data_Offset_Array,
+                    int(data_array_lenght_list[0]) * elem_dtype.itemsize,
+                    data_dtype=elem_dtype,header_bytes=26)
+        else:
+            for ND in range(0,N_Dimensions):
+                data_array_list[ND] = get_1DdataElementData(image_byte_array,Data_Offset_Array[ND],data_type_ID,int(data_type_list[ND]),int(data_array_lenght_list[ND]))
+
+    #Wait for all queued image saves to finish (result() re-raises
+    #any exception from the worker threads)
+    for save_future in save_future_list:
+        save_future.result()
+
+    save_executor.shutdown()
 
     log.info("...done")
 
@@ -2,7 +2,6 @@
 subclass of the given serial image. 
 """
 
-from codecs import open
 import logging
 import numpy as np
 
@@ -21,11 +20,11 @@ class SeriesData(object):
         assert data_type_id == '0x4120' or data_type_id == '0x4122', "Invalid data type ID: {0:s}".format(data_type_id)
         self.data_type_id = data_type_id
 
-        assert tag_type_id == '' or tag_type_id == '', "Invalid tag type ID: {0:s}".format(tag_type_id)
+        assert tag_type_id == '0x4152' or tag_type_id == '0x4142', "Invalid tag type ID: {0:s}".format(tag_type_id)
         self.tag_type_id = tag_type_id
 
 
 
 #Just for quick testing
 if __name__ == '__main__':
-    A = SeriesData('0x0220','0x4122',2)
\ No newline at end of file
+    A = SeriesData('0x0220','0x4122','0x4142')
\ No newline at end of file
@@ -1,15 +1,14 @@
 from setuptools import setup
-from codecs import open
 import os
 import re
 
-with open("requirements.txt", "r") as f:
+with open("requirements.txt", "r", encoding="utf-8") as f:
     requirements = f.read().splitlines()
 
 def get_version():
     version_file = os.path.join(os.path.abspath(os.path.dirname(__file__)),'sereader','__version__.py')
 
-    with open(version_file, "r") as f:
+    with open(version_file, "r", encoding="utf-8") as f:
         lines = f.read()
         version = re.search(r"^_*version_* = ['\"]([^'\"]*)['\"]", lines, re.M).group(1)
         f.close()